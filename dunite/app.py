@@ -10,11 +10,12 @@ from __future__ import annotations
 import asyncio
 import logging
 import signal
-from typing import Any, Callable, Dict, Optional, Set
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set
 
 from .client import Client
 from .context import Context
 from .types.events import EventType
+from .types.messages import Message, MessageKind
 from .ws.server import WebSocketHandler, serve
 
 
@@ -34,12 +35,15 @@ class Server:
         self.logger = logger
         self.name = name
 
-        self._event_handlers: Dict[EventType, Set[EventHandler]] = {}
+        self._event_handlers: Dict[EventType, List[EventHandler]] = {}
+        self._event_dispatchers: Dict[EventType, EventDispatcher] = {}
+        self._auto_subscribe_cache: Optional[FrozenSet[EventType]] = None
         self._clients: Set[Client] = set()
         self._running = False
         self._tasks: Set[asyncio.Task] = set()
         self._ws_server = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._shutdown_event: Optional[asyncio.Event] = None
 
     def on(
         self, event_type: str | EventType, *, auto_subscribe: bool = True
@@ -59,15 +63,15 @@ class Server:
                 await ctx.reply("Hello!")
         """
         if isinstance(event_type, str):
-            try:
-                event_type = EventType(event_type)
-            except ValueError:
-                raise ValueError(f"Unknown event type: {event_type}")
+            event_type = EventType(event_type)
 
         def decorator(handler: EventHandler) -> EventHandler:
-            handlers = self._event_handlers.setdefault(event_type, set())
-            handlers.add(handler)
+            handlers = self._event_handlers.setdefault(event_type, [])
+            if handler not in handlers:
+                handlers.append(handler)
             handler._auto_subscribe = auto_subscribe  # type: ignore
+            self._event_dispatchers[event_type] = self._compile_dispatcher(event_type)
+            self._auto_subscribe_cache = None
             return handler
 
         return decorator
@@ -84,17 +88,22 @@ class Server:
 
         try:
             # Subscribe to events that have handlers with auto_subscribe
-            for event_type, handlers in self._event_handlers.items():
-                if any(getattr(h, "_auto_subscribe", True) for h in handlers):
-                    await client.subscribe(event_type)
+            subs = [client.subscribe(et) for et in self._auto_subscribe_types()]
+            await asyncio.gather(*subs)
 
             while not client.closed:
                 try:
-                    message = await client.receive_message()
-                    task = asyncio.create_task(self._handle_message(client, message))
-                    self._tasks.add(task)
-                    task.add_done_callback(self._tasks.discard)
+                    kind, event_name, message = await client.receive_message()
+                    self._track_task(
+                        asyncio.create_task(
+                            self._handle_message(client, kind, event_name, message)
+                        )
+                    )
                 except Exception as e:
+                    # recv() fails once the connection closes, which is a
+                    # normal disconnect rather than a receive error
+                    if client.closed:
+                        break
                     self.logger.error(f"Error handling message: {e}")
 
         except Exception as e:
@@ -102,11 +111,74 @@ class Server:
         finally:
             await self._cleanup_client(client)
 
-    async def _handle_message(self, client: Client, message: Dict[str, Any]) -> None:
+    def _compile_dispatcher(self, event_type: EventType) -> EventDispatcher:
+        """
+        Generate a dispatcher for the handlers registered to an event type.
+
+        The dispatcher schedules each handler as a task, in registration
+        order, with the loop over handlers unrolled, so per-event dispatch
+        does no iteration or attribute lookups. It is regenerated whenever a
+        handler is added.
+
+        :param event_type: Event type to compile the dispatcher for
+        :return: Function taking ``(context, create_task, track_task)``
+        """
+        name = f"_dispatch_{event_type.name.lower()}"
+        namespace: Dict[str, Any] = {"logger": self.logger, "event_type": event_type}
+        lines = [f"def {name}(context, create_task, track_task):"]
+        for i, handler in enumerate(self._event_handlers[event_type]):
+            namespace[f"handler{i}"] = handler
+            lines += [
+                "    try:",
+                f"        track_task(create_task(handler{i}(context)))",
+                "    except Exception:",
+                '        logger.exception(f"Error in event handler for {event_type}")',
+            ]
+        exec("\n".join(lines), namespace)
+        return namespace[name]
+
+    def _track_task(self, task: asyncio.Task) -> None:
+        """
+        Keep a strong reference to a task until it finishes.
+
+        The event loop only holds weak references to tasks. Tasks that the
+        eager task factory already ran to completion are not tracked.
+
+        :param task: Task to track
+        """
+        if not task.done():
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _auto_subscribe_types(self) -> FrozenSet[EventType]:
+        """
+        Get the event types that should be subscribed to on connect.
+
+        The result is cached until another handler is registered.
+
+        :return: Event types with at least one auto-subscribing handler
+        """
+        if self._auto_subscribe_cache is None:
+            self._auto_subscribe_cache = frozenset(
+                et
+                for et, hs in self._event_handlers.items()
+                if any(getattr(h, "_auto_subscribe", True) for h in hs)
+            )
+        return self._auto_subscribe_cache
+
+    async def _handle_message(
+        self,
+        client: Client,
+        kind: MessageKind,
+        event_name: Optional[str],
+        message: Message,
+    ) -> None:
         """
         Handle a received message.
 
         :param client: Client that sent the message
+        :param kind: Message kind as classified by the client
+        :param event_name: Event name for event messages, otherwise None
         :param message: Message to handle
         """
         try:
@@ -114,29 +186,16 @@ class Server:
             await client.handle_message(message)
 
             # Handle events
-            header = message.get("header", {})
-            if header.get("messagePurpose") == "event":
-                body = message.get("body", {})
-                event_name = body.get("eventName")
-                if event_name:
-                    try:
-                        event_type = EventType(event_name)
-                    except ValueError:
-                        self.logger.warning(f"Unknown event type: {event_name}")
-                        return
-
-                    handlers = self._event_handlers.get(event_type, set())
-                    if handlers:
-                        context = Context.from_event(client, message)
-                        for handler in handlers:
-                            try:
-                                task = asyncio.create_task(handler(context))
-                                self._tasks.add(task)
-                                task.add_done_callback(self._tasks.discard)
-                            except Exception:
-                                self.logger.exception(
-                                    f"Error in event handler for {event_type}"
-                                )
+            if kind is MessageKind.EVENT:
+                event_type = EventType.from_name(event_name)
+                if event_type is None:
+                    self.logger.warning(f"Unknown event type: {event_name}")
+                    return
+
+                dispatcher = self._event_dispatchers.get(event_type)
+                if dispatcher is not None:
+                    context = Context.from_event(client, message)  # type: ignore
+                    dispatcher(context, asyncio.create_task, self._track_task)
 
         except Exception as e:
             self.logger.error(f"Error processing message: {e}")
@@ -147,12 +206,15 @@ class Server:
 
         :param client: Client to clean up
         """
+        # Shutdown and the client's own handler may both get here
+        if client not in self._clients:
+            return
+        self._clients.discard(client)
         try:
             await client.close()
         except Exception:
             self.logger.exception("Error closing client")
         finally:
-            self._clients.discard(client)
             self.logger.info(f"Client disconnected: {client.id}")
 
     async def _shutdown(self) -> None:
@@ -160,15 +222,18 @@ class Server:
         self._running = False
 
         # Close all clients
-        for client in list(self._clients):
-            await self._cleanup_client(client)
+        await asyncio.gather(
+            *(self._cleanup_client(c) for c in list(self._clients)),
+            return_exceptions=True,
+        )
 
         # Cancel all tasks
-        for task in self._tasks:
+        tasks = list(self._tasks)
+        for task in tasks:
             task.cancel()
 
-        if self._tasks:
-            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     def run(self, host: str = "localhost", port: int = 8765, **kwargs: Any) -> None:
         """
@@ -182,12 +247,18 @@ class Server:
         async def server_main() -> None:
             self._running = True
             self._loop = asyncio.get_running_loop()
+            self._shutdown_event = asyncio.Event()
+
+            # Let tasks that finish without blocking skip the scheduler (3.12+)
+            if hasattr(asyncio, "eager_task_factory"):
+                self._loop.set_task_factory(asyncio.eager_task_factory)
 
             def signal_handler():
                 if not self._running:
                     return
+                # server_main wakes up and shuts down in its finally block
                 self._running = False
-                asyncio.create_task(self._shutdown())
+                self._shutdown_event.set()
 
             # Set up signal handlers
             for sig in (signal.SIGINT, signal.SIGTERM):
@@ -204,8 +275,7 @@ class Server:
                 self.logger.info(f"Server running on ws://{host}:{port}")
 
                 # Wait until shutdown is triggered
-                while self._running:
-                    await asyncio.sleep(0.1)
+                await self._shutdown_event.wait()
 
             except Exception as e:
                 self.logger.error(f"Server error: {e}")
@@ -223,3 +293,6 @@ class Server:
 
 # Type alias for event handlers
 EventHandler = Callable[[Context], Any]
+
+# Type alias for generated per-event dispatchers
+EventDispatcher = Callable[[Context, Callable[..., Any], Any], None]
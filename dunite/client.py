@@ -8,26 +8,89 @@ with Minecraft and manages command execution and event subscriptions.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import uuid
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Optional, Tuple, Union
+
+import orjson
 
 from .exceptions import ClientError, CommandError, ProtocolError, SubscriptionError
 from .types.commands import Command, CommandResponse
 from .types.events import EventType
 from .types.messages import (
     CommandRequestMessage,
-    CommandResponseMessage,
-    ErrorMessage,
-    EventMessage,
     Message,
+    MessageKind,
     MessagePurpose,
     MessageType,
 )
 from .ws.frames import CloseCode
 from .ws.server import WebSocketHandler
 
+# Constant header fields, copied per request to avoid rebuilding them
+_CMD_HEADER_TMPL: Dict[str, Any] = {
+    "version": 1,
+    "messagePurpose": MessagePurpose.COMMAND_REQUEST,
+    "messageType": MessageType.COMMAND_REQUEST,
+}
+_SUB_HEADER_TMPL: Dict[str, Any] = {
+    "version": 1,
+    "messagePurpose": MessagePurpose.SUBSCRIBE,
+    "messageType": MessageType.COMMAND_REQUEST,
+}
+_UNSUB_HEADER_TMPL: Dict[str, Any] = {
+    "version": 1,
+    "messagePurpose": MessagePurpose.UNSUBSCRIBE,
+    "messageType": MessageType.COMMAND_REQUEST,
+}
+_PLAYER_ORIGIN: Dict[str, Any] = {"type": "player"}
+
+# Incoming message purposes mapped straight to their kind
+_PURPOSE_DISPATCH: Dict[str, MessageKind] = {
+    MessagePurpose.COMMAND_RESPONSE.value: MessageKind.COMMAND_RESPONSE,
+    MessagePurpose.EVENT.value: MessageKind.EVENT,
+    MessagePurpose.ERROR.value: MessageKind.ERROR,
+}
+
+
+def parse_and_route(
+    raw: Union[str, bytes],
+) -> Tuple[MessageKind, Optional[str], Message]:
+    """
+    Decode, validate and classify a raw message in a single pass.
+
+    The header and body are each looked up once, and the event name is
+    handed back alongside the message so callers don't walk it again.
+
+    :param raw: Raw JSON message
+    :return: Tuple of (message kind, event name for events or None, message)
+    :raises orjson.JSONDecodeError: If the message is not valid JSON
+    :raises ProtocolError: If message format is invalid
+    """
+    message = orjson.loads(raw)
+    if not isinstance(message, dict):
+        raise ProtocolError("Message must be a dictionary", message)
+
+    header = message.get("header")
+    if not isinstance(header, dict):
+        raise ProtocolError("Message must have a header", message)
+
+    purpose = header.get("messagePurpose")
+    if not purpose:
+        raise ProtocolError("Message must have a purpose", message)
+
+    kind = _PURPOSE_DISPATCH.get(purpose)
+    if kind is None:
+        raise ProtocolError(f"Unknown message purpose: {purpose}", message)
+
+    if kind is MessageKind.EVENT:
+        body = message.get("body")
+        event_name = body.get("eventName") if isinstance(body, dict) else None
+        if not event_name or not isinstance(event_name, str):
+            raise ProtocolError("Event message must have an event name", message)
+        return kind, event_name, message  # type: ignore
+    return kind, None, message  # type: ignore
+
 
 class Client:
     """
@@ -39,6 +102,16 @@ class Client:
     :param logger: Optional logger instance
     """
 
+    __slots__ = (
+        "handler",
+        "logger",
+        "id",
+        "_req_counter",
+        "_subscribed_mask",
+        "_pending_requests",
+        "_closed",
+    )
+
     def __init__(
         self,
         handler: WebSocketHandler,
@@ -50,9 +123,9 @@ class Client:
         self.logger = logger
 
         self.id = str(uuid.uuid4())
-        self._subscribed_events: Set[EventType] = set()
+        self._req_counter = 0
+        self._subscribed_mask = 0  # bit per EventType._ordinal
         self._pending_requests: Dict[str, asyncio.Future[Message]] = {}
-        self._response_lock = asyncio.Lock()
         self._closed = False
 
     @property
@@ -60,6 +133,19 @@ class Client:
         """Whether the client connection is closed."""
         return self._closed or self.handler.closed
 
+    def _next_request_id(self) -> str:
+        """
+        Generate a request ID unique to this client.
+
+        The ID keeps the UUID shape by replacing the last group of the client
+        ID with a per-client counter, which avoids generating a fresh UUID
+        for every request.
+
+        :return: Request ID
+        """
+        self._req_counter += 1
+        return f"{self.id[:24]}{self._req_counter & 0xFFFFFFFFFFFF:012x}"
+
     async def send_message(self, message: Dict[str, Any]) -> None:
         """
         Send a message to the client.
@@ -71,15 +157,16 @@ class Client:
             raise ClientError("Connection is closed", self.id)
 
         try:
-            await self.handler.send(json.dumps(message))
+            await self.handler.send(orjson.dumps(message))
         except Exception as e:
             raise ClientError(f"Failed to send message: {e}", self.id) from e
 
-    async def receive_message(self) -> Message:
+    async def receive_message(self) -> Tuple[MessageKind, Optional[str], Message]:
         """
         Receive a message from the client.
 
-        :return: Received message
+        :return: Tuple of (message kind, event name, received message),
+            see :func:`parse_and_route`
         :raises ClientError: If connection is closed or receive fails
         :raises ProtocolError: If message format is invalid
         """
@@ -88,47 +175,12 @@ class Client:
 
         try:
             data = await self.handler.recv()
-            if isinstance(data, bytes):
-                data = data.decode("utf-8")
-            message = json.loads(data)
-            return self._validate_message(message)
-        except json.JSONDecodeError as e:
+            return parse_and_route(data)
+        except orjson.JSONDecodeError as e:
             raise ProtocolError("Invalid JSON message", None) from e
         except Exception as e:
             raise ClientError(f"Failed to receive message: {e}", self.id) from e
 
-    def _validate_message(self, message: Dict[str, Any]) -> Message:
-        """
-        Validate and type a received message.
-
-        :param message: Raw message dictionary
-        :return: Typed message
-        :raises ProtocolError: If message format is invalid
-        """
-        if not isinstance(message, dict):
-            raise ProtocolError("Message must be a dictionary", message)
-
-        header = message.get("header")
-        if not isinstance(header, dict):
-            raise ProtocolError("Message must have a header", message)
-
-        purpose = header.get("messagePurpose")
-        if not purpose:
-            raise ProtocolError("Message must have a purpose", message)
-
-        # Type the message based on its purpose
-        try:
-            if purpose == MessagePurpose.COMMAND_RESPONSE:
-                return CommandResponseMessage(**message)  # type: ignore
-            elif purpose == MessagePurpose.EVENT:
-                return EventMessage(**message)  # type: ignore
-            elif purpose == MessagePurpose.ERROR:
-                return ErrorMessage(**message)  # type: ignore
-            else:
-                raise ProtocolError(f"Unknown message purpose: {purpose}", message)
-        except Exception as e:
-            raise ProtocolError(f"Invalid message structure: {e}", message) from e
-
     async def run_command(self, command: Command) -> CommandResponse:
         """
         Run a Minecraft command.
@@ -138,37 +190,39 @@ class Client:
         :raises CommandError: If command execution fails
         :raises ClientError: If connection is closed
         """
-        request_id = str(uuid.uuid4())
+        request_id = self._next_request_id()
+        header = _CMD_HEADER_TMPL.copy()
+        header["requestId"] = request_id
         message: CommandRequestMessage = {
-            "header": {
-                "version": 1,
-                "requestId": request_id,
-                "messagePurpose": MessagePurpose.COMMAND_REQUEST,
-                "messageType": MessageType.COMMAND_REQUEST,
-            },
+            "header": header,  # type: ignore
             "body": {
                 "version": 1,
                 "commandLine": str(command),
-                "origin": {"type": "player"},
+                "origin": _PLAYER_ORIGIN,  # type: ignore
             },
         }
 
         future: asyncio.Future[Message] = asyncio.Future()
         self._pending_requests[request_id] = future
 
+        # handle_message pops the entry when the response arrives, so it only
+        # needs removing here if the request never got one
         try:
             await self.send_message(message)
-            response = await asyncio.wait_for(future, timeout=10.0)
-
-            if "error" in response["header"]["messagePurpose"]:
-                error_msg = response["body"]["statusMessage"]
-                raise CommandError(error_msg, -1, str(command))
-
-            return CommandResponse.from_dict(response)
+            async with asyncio.timeout(10.0):
+                response = await future
         except asyncio.TimeoutError:
+            self._pending_requests.pop(request_id, None)
             raise CommandError("Command timed out", -1, str(command))
-        finally:
+        except BaseException:
             self._pending_requests.pop(request_id, None)
+            raise
+
+        if "error" in response["header"]["messagePurpose"]:
+            error_msg = response["body"]["statusMessage"]
+            raise CommandError(error_msg, -1, str(command))
+
+        return CommandResponse.from_dict(response)
 
     async def subscribe(self, event_type: EventType) -> None:
         """
@@ -177,22 +231,17 @@ class Client:
         :param event_type: Event type to subscribe to
         :raises SubscriptionError: If subscription fails
         """
-        if event_type in self._subscribed_events:
+        bit = 1 << event_type._ordinal
+        if self._subscribed_mask & bit:
             return
 
-        message = {
-            "header": {
-                "version": 1,
-                "requestId": str(uuid.uuid4()),
-                "messagePurpose": MessagePurpose.SUBSCRIBE,
-                "messageType": MessageType.COMMAND_REQUEST,
-            },
-            "body": {"eventName": event_type.value},
-        }
+        header = _SUB_HEADER_TMPL.copy()
+        header["requestId"] = self._next_request_id()
+        message = {"header": header, "body": {"eventName": event_type.value}}
 
         try:
             await self.send_message(message)
-            self._subscribed_events.add(event_type)
+            self._subscribed_mask |= bit
         except Exception as e:
             raise SubscriptionError(f"Failed to subscribe: {e}", event_type.value)
 
@@ -203,22 +252,17 @@ class Client:
         :param event_type: Event type to unsubscribe from
         :raises SubscriptionError: If unsubscription fails
         """
-        if event_type not in self._subscribed_events:
+        bit = 1 << event_type._ordinal
+        if not self._subscribed_mask & bit:
             return
 
-        message = {
-            "header": {
-                "version": 1,
-                "requestId": str(uuid.uuid4()),
-                "messagePurpose": MessagePurpose.UNSUBSCRIBE,
-                "messageType": MessageType.COMMAND_REQUEST,
-            },
-            "body": {"eventName": event_type.value},
-        }
+        header = _UNSUB_HEADER_TMPL.copy()
+        header["requestId"] = self._next_request_id()
+        message = {"header": header, "body": {"eventName": event_type.value}}
 
         try:
             await self.send_message(message)
-            self._subscribed_events.remove(event_type)
+            self._subscribed_mask &= ~bit
         except Exception as e:
             raise SubscriptionError(f"Failed to unsubscribe: {e}", event_type.value)
 
@@ -231,10 +275,9 @@ class Client:
         header = message["header"]
         request_id = header.get("requestId")
 
-        if request_id in self._pending_requests:
-            future = self._pending_requests[request_id]
-            if not future.done():
-                future.set_result(message)
+        future = self._pending_requests.pop(request_id, None)
+        if future is not None and not future.done():
+            future.set_result(message)
 
     async def close(self) -> None:
         """Close the client connection."""
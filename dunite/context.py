@@ -7,8 +7,8 @@ containing all relevant information about the event and client state.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from .types.events import Event, EventData, EventType
 from .types.commands import Command, CommandResponse
@@ -17,7 +17,7 @@ if TYPE_CHECKING:
     from .client import Client
 
 
-@dataclass
+@dataclass(slots=True)
 class Context:
     """
     Context for event handlers.
@@ -25,14 +25,23 @@ class Context:
     Provides access to the client connection, event data, and utility methods
     for interacting with the Minecraft client.
 
+    The typed event data is parsed from ``raw_data`` on first access of
+    :attr:`event`, so handlers that never read it don't pay for parsing.
+
     :param client: Client instance representing the Minecraft connection
-    :param event: Event data
     :param raw_data: Raw event data from Minecraft
     """
 
     client: Client
-    event: Event
     raw_data: Dict[str, Any]
+    _event: Optional[Event] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def event(self) -> Event:
+        """Get the event data, parsing it from the raw data on first access."""
+        if self._event is None:
+            self._event = EventData.from_dict(self.raw_data)
+        return self._event
 
     @property
     def event_type(self) -> EventType:
@@ -95,10 +104,8 @@ class Context:
         :param client: Client instance
         :param event_data: Raw event data from Minecraft
         :return: Context instance
-        :raises ValueError: If event data is invalid
         """
-        event = EventData.from_dict(event_data)
-        return Context(client=client, event=event, raw_data=event_data)
+        return Context(client=client, raw_data=event_data)
 
     def __repr__(self) -> str:
         """Return string representation of the context."""
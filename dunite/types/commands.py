@@ -7,13 +7,14 @@ Minecraft commands and their responses.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 from ..exceptions import CommandError
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommandResponse:
     """
     Represents a response from a Minecraft command.
@@ -47,14 +48,31 @@ class CommandResponse:
         :return: CommandResponse instance
         """
         body = data.get("body", {})
+        code = body.get("statusCode", -1)
+        status_message = body.get("statusMessage", "Unknown error")
+        if code == 0:
+            return CommandResponse._from_validated(code, status_message, data)
         return CommandResponse(
-            code=body.get("statusCode", -1),
-            status_message=body.get("statusMessage", "Unknown error"),
-            raw_response=data,
+            code=code, status_message=status_message, raw_response=data
         )
 
+    @classmethod
+    def _from_validated(
+        cls, code: int, status_message: str, raw_response: Dict[str, Any]
+    ) -> CommandResponse:
+        """
+        Create a CommandResponse without running ``__post_init__``.
+
+        Only for callers that have already checked the status code is 0.
+        """
+        self = object.__new__(cls)
+        object.__setattr__(self, "code", code)
+        object.__setattr__(self, "status_message", status_message)
+        object.__setattr__(self, "raw_response", raw_response)
+        return self
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Command:
     """
     Represents a Minecraft command to be executed.
@@ -79,10 +97,27 @@ class Command:
         """
         Parse a command line into a Command object.
 
+        Results are cached, so repeated command lines share the same
+        immutable instance.
+
         :param command_line: Command line string
         :return: Command instance
         """
-        parts = command_line.strip().split(maxsplit=1)
-        name = parts[0]
-        args = parts[1] if len(parts) > 1 else None
-        return Command(name=name, args=args)
+        return _parse_cached(command_line)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_cached(command_line: str) -> Command:
+    """
+    Split a command line into its name and arguments.
+
+    Results are shared between callers through the cache, so the returned
+    Command must stay immutable; this is why Command is frozen.
+
+    :param command_line: Command line string
+    :return: Command instance
+    """
+    parts = command_line.strip().split(maxsplit=1)
+    name = parts[0]
+    args = parts[1] if len(parts) > 1 else None
+    return Command(name=name, args=args)
@@ -9,12 +9,12 @@ from __future__ import annotations
 
 import enum
 from dataclasses import dataclass
-from typing import Any, Dict, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 from .messages import EventProperties
 
 
-class EventType(str, enum.Enum):
+class EventType(enum.StrEnum):
     """
     Available Minecraft event types.
 
@@ -107,6 +107,31 @@ class EventType(str, enum.Enum):
     WORLD_LOADED = "WorldLoaded"
     WORLD_UNLOADED = "WorldUnloaded"
 
+    # Position of the member in definition order, used for subscription bitmasks
+    _ordinal: int
+
+    @classmethod
+    def _missing_(cls, value: object) -> EventType:
+        raise ValueError(f"Unknown event type: {value}")
+
+    @classmethod
+    def from_name(cls, name: Optional[str]) -> Optional[EventType]:
+        """
+        Look up an event type by the event name Minecraft sends.
+
+        :param name: Event name
+        :return: Matching event type, or None if the name is unknown
+        """
+        return _EVENT_TYPE_BY_NAME.get(name)
+
+
+for _ordinal, _member in enumerate(EventType):
+    _member._ordinal = _ordinal
+del _ordinal, _member
+
+# Event names mapped to their EventType, avoiding the enum constructor
+_EVENT_TYPE_BY_NAME: Dict[str, EventType] = {e.value: e for e in EventType}
+
 
 class PlayerGameMode(enum.IntEnum):
     """Player game mode values."""
@@ -206,7 +231,27 @@ class Biome(enum.IntEnum):
     STONY_PEAKS = 189
 
 
-@dataclass
+# Event-specific constructors used by EventData.from_dict
+_FromDict = Callable[[Dict[str, Any]], "EventData"]
+_FROM_DICT_REGISTRY: Dict[EventType, _FromDict] = {}
+
+
+def _handles(event_type: EventType) -> Callable[[_FromDict], _FromDict]:
+    """
+    Register a ``from_dict`` constructor for an event type.
+
+    :param event_type: Event type the constructor handles
+    :return: Decorator that registers and returns the constructor
+    """
+
+    def decorator(fn: _FromDict) -> _FromDict:
+        _FROM_DICT_REGISTRY[event_type] = fn
+        return fn
+
+    return decorator
+
+
+@dataclass(slots=True)
 class EventData:
     """
     Base class for event data.
@@ -230,36 +275,48 @@ class EventData:
         body = data.get("body", {})
         event_name = body.get("eventName")
 
-        try:
-            event_type = EventType(event_name)
-        except ValueError:
+        event_type = _EVENT_TYPE_BY_NAME.get(event_name)
+        if event_type is None:
             raise ValueError(f"Unknown event type: {event_name}")
 
         # Create specific event data class based on event type
-        if event_type == EventType.PLAYER_MESSAGE:
-            return PlayerMessageData.from_dict(data)
-        # Add more specific event types here as needed
+        handler = _FROM_DICT_REGISTRY.get(event_type)
+        if handler is not None:
+            return handler(data)
 
-        return EventData(event_type=event_type, raw_data=data)
+        return EventData(event_type, data)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerMessageData(EventData):
     """
     Data for PlayerMessage events.
 
-    :param sender: Name of the player who sent the message
-    :param message: Content of the message
-    :param message_type: Type of message (e.g., "chat")
-    :param properties: Additional message properties
+    The message fields are read from ``properties`` when accessed rather
+    than copied out up front.
+
+    :param properties: Message properties
     """
 
-    sender: str
-    message: str
-    message_type: str
     properties: EventProperties
 
+    @property
+    def sender(self) -> str:
+        """Name of the player who sent the message."""
+        return self.properties.get("Sender", "")
+
+    @property
+    def message(self) -> str:
+        """Content of the message."""
+        return self.properties.get("Message", "")
+
+    @property
+    def message_type(self) -> str:
+        """Type of message (e.g., "chat")."""
+        return self.properties.get("MessageType", "")
+
     @staticmethod
+    @_handles(EventType.PLAYER_MESSAGE)
     def from_dict(data: Dict[str, Any]) -> PlayerMessageData:
         """
         Create a PlayerMessageData instance from a dictionary.
@@ -267,17 +324,8 @@ class PlayerMessageData(EventData):
         :param data: Dictionary containing event data
         :return: PlayerMessageData instance
         """
-        body = data.get("body", {})
-        properties = body.get("properties", {})
-
-        return PlayerMessageData(
-            event_type=EventType.PLAYER_MESSAGE,
-            sender=properties.get("Sender", ""),
-            message=properties.get("Message", ""),
-            message_type=properties.get("MessageType", ""),
-            properties=properties,
-            raw_data=data,
-        )
+        properties = data.get("body", {}).get("properties", {})
+        return PlayerMessageData(EventType.PLAYER_MESSAGE, data, properties)
 
 
 # Type alias for all possible event data types
@@ -7,7 +7,7 @@ Minecraft and the WebSocket server.
 
 from __future__ import annotations
 
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Any, Optional, TypedDict, Union
 
 
@@ -22,6 +22,14 @@ class MessagePurpose(str, Enum):
     UNSUBSCRIBE = "unsubscribe"
 
 
+class MessageKind(IntEnum):
+    """Classification of a validated incoming message."""
+
+    COMMAND_RESPONSE = 0
+    EVENT = 1
+    ERROR = 2
+
+
 class MessageType(str, Enum):
     """Message type enum for header."""
 
@@ -15,6 +15,7 @@ __all__ = [
     "InvalidURI",
     "PayloadError",
     "FrameError",
+    "IncompleteFrame",
     "HeaderError",
 ]
 
@@ -96,6 +97,10 @@ class FrameError(ProtocolError):
     """Raised when there's an error with a WebSocket frame."""
 
 
+class IncompleteFrame(FrameError):
+    """Raised when the buffer ends before a complete WebSocket frame."""
+
+
 class HeaderError(HandshakeError):
     """Raised when there's an error with HTTP headers."""
 
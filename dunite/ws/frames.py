@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import enum
 import struct
-from typing import NamedTuple, Optional, Tuple, Union
+from typing import Dict, NamedTuple, Optional, Tuple, Union
 
-from .exceptions import FrameError, PayloadError
+from .exceptions import FrameError, IncompleteFrame, PayloadError
 from .utils import BytesLike, apply_mask
 
 __all__ = [
@@ -36,6 +36,9 @@ class Opcode(enum.IntEnum):
 CONTROL_FRAMES = {Opcode.CLOSE, Opcode.PING, Opcode.PONG}
 DATA_FRAMES = {Opcode.CONTINUATION, Opcode.TEXT, Opcode.BINARY}
 
+# Opcode lookup by value, avoiding the enum constructor on every frame
+_OPCODES: Dict[int, Opcode] = {op.value: op for op in Opcode}
+
 
 class CloseCode(enum.IntEnum):
     """
@@ -105,7 +108,8 @@ class Frame:
         rsv3: bool = False,
     ) -> None:
         self.fin = fin
-        self.opcode = Opcode(opcode)
+        op = _OPCODES.get(opcode)
+        self.opcode = op if op is not None else Opcode(opcode)
         self.payload = bytes(payload)
         self.rsv1 = rsv1
         self.rsv2 = rsv2
@@ -118,7 +122,7 @@ class Frame:
 
         :raises FrameError: If frame is invalid
         """
-        if self.opcode not in list(Opcode):
+        if self.opcode not in _OPCODES:
             raise FrameError(f"Invalid opcode: {self.opcode}")
 
         if self.opcode in CONTROL_FRAMES:
@@ -209,11 +213,12 @@ def parse_frame(
     :param data: Raw frame data
     :param max_size: Maximum allowed payload size
     :return: Tuple of (parsed frame, number of bytes consumed)
+    :raises IncompleteFrame: If data does not yet hold a complete frame
     :raises FrameError: If frame format is invalid
     :raises PayloadError: If payload exceeds max_size
     """
     if len(data) < 2:
-        raise FrameError("Frame too short")
+        raise IncompleteFrame("Frame too short")
 
     # Parse first byte
     first_byte = data[0]
@@ -221,12 +226,9 @@ def parse_frame(
     rsv1 = bool(first_byte & 0b01000000)
     rsv2 = bool(first_byte & 0b00100000)
     rsv3 = bool(first_byte & 0b00010000)
-    opcode = first_byte & 0b00001111
-
-    try:
-        opcode = Opcode(opcode)
-    except ValueError:
-        raise FrameError(f"Invalid opcode: {opcode}")
+    opcode = _OPCODES.get(first_byte & 0b00001111)
+    if opcode is None:
+        raise FrameError(f"Invalid opcode: {first_byte & 0b00001111}")
 
     # Parse second byte
     second_byte = data[1]
@@ -239,13 +241,13 @@ def parse_frame(
     # Handle extended payload length
     if payload_length == 126:
         if len(data) < pos + 2:
-            raise FrameError("Frame too short for 2-byte payload length")
-        payload_length = struct.unpack("!H", data[pos : pos + 2])[0]
+            raise IncompleteFrame("Frame too short for 2-byte payload length")
+        payload_length = struct.unpack_from("!H", data, pos)[0]
         pos += 2
     elif payload_length == 127:
         if len(data) < pos + 8:
-            raise FrameError("Frame too short for 8-byte payload length")
-        payload_length = struct.unpack("!Q", data[pos : pos + 8])[0]
+            raise IncompleteFrame("Frame too short for 8-byte payload length")
+        payload_length = struct.unpack_from("!Q", data, pos)[0]
         pos += 8
 
     if max_size is not None and payload_length > max_size:
@@ -257,18 +259,22 @@ def parse_frame(
     mask_key = None
     if masked:
         if len(data) < pos + 4:
-            raise FrameError("Frame too short for mask key")
-        mask_key = data[pos : pos + 4]
+            raise IncompleteFrame("Frame too short for mask key")
+        mask_key = bytes(data[pos : pos + 4])
         pos += 4
 
     # Check if we have the full payload
     if len(data) < pos + payload_length:
-        raise FrameError("Frame too short for payload")
-
-    # Extract payload
-    payload = data[pos : pos + payload_length]
-    if masked:
-        payload = apply_mask(payload, mask_key)
+        raise IncompleteFrame("Frame too short for payload")
+
+    # Extract payload through a view so it is copied only once; the view is
+    # released before returning so callers may resize a bytearray buffer
+    end = pos + payload_length
+    with memoryview(data) as view:
+        if masked:
+            payload = apply_mask(view[pos:end], mask_key)
+        else:
+            payload = bytes(view[pos:end])
 
     frame = Frame(
         fin=fin,
@@ -279,7 +285,7 @@ def parse_frame(
         rsv3=rsv3,
     )
 
-    return frame, pos + payload_length
+    return frame, end
 
 
 def create_frame(
@@ -3,7 +3,6 @@ from __future__ import annotations
 import base64
 import collections
 import email.utils
-import hashlib
 import http
 import re
 from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
@@ -379,15 +378,3 @@ def _is_valid_accept(accept: str) -> bool:
         return len(decoded) == 20
     except Exception:
         return False
-
-
-def compute_accept_key(key: str) -> str:
-    """
-    Compute Sec-WebSocket-Accept header value.
-
-    :param key: Sec-WebSocket-Key header value
-    :return: Computed accept key
-    """
-    GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
-    accept = hashlib.sha1((key + GUID).encode()).digest()
-    return base64.b64encode(accept).decode()
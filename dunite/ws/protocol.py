@@ -8,7 +8,7 @@ from typing import List, Optional, Set, Union
 
 from .exceptions import (
     ConnectionClosed,
-    FrameError,
+    IncompleteFrame,
     ProtocolError,
 )
 from .frames import (
@@ -170,7 +170,7 @@ class WebSocketProtocol:
                 frame, consumed = parse_frame(
                     self._incoming_buffer, max_size=self.max_size
                 )
-            except FrameError:
+            except IncompleteFrame:
                 # Not enough data for a complete frame
                 break
 
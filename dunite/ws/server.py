@@ -5,16 +5,44 @@ WebSocket server implementation.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import ssl
-from typing import Any, Awaitable, Callable, Optional
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Optional, Union
 
-from .exceptions import WebSocketError
+from .exceptions import IncompleteFrame, WebSocketError
 from .frames import CloseCode, Frame, Opcode, parse_frame
 from .http import Headers, build_response, parse_request, validate_handshake
 from .protocol import State, WebSocketProtocol
 from .utils import compute_accept_key
 
+_DEFAULT_LOGGER = logging.getLogger("dunite.ws")
+
+# Maximum number of queued frames written per drain, to bound latency
+_MAX_WRITE_BATCH = 32
+
+# Maximum number of outgoing frames queued before send() waits for the writer
+_MAX_QUEUED_FRAMES = 256
+
+# Opcodes bound at module scope for identity checks in the reader loop
+_TEXT = Opcode.TEXT
+_CLOSE = Opcode.CLOSE
+_PING = Opcode.PING
+_PONG = Opcode.PONG
+
+
+@functools.lru_cache(maxsize=64)
+def _serialize_control(opcode: Opcode, payload: bytes) -> bytes:
+    """
+    Serialize an unmasked control frame, reusing the bytes for repeats.
+
+    :param opcode: Control frame opcode
+    :param payload: Frame payload
+    :return: Serialized frame
+    """
+    return Frame(fin=True, opcode=opcode, payload=payload).serialize(mask=False)
+
 
 class WebSocketHandler:
     def __init__(
@@ -26,11 +54,21 @@ class WebSocketHandler:
         self.reader = reader
         self.writer = writer
         if logger is None:
-            logger = logging.getLogger("dunite.ws")
+            logger = _DEFAULT_LOGGER
         self.logger = logger
         self.protocol = WebSocketProtocol(logger=logger)
         self._closed = False
-        self._message_queue: asyncio.Queue[str] = asyncio.Queue()
+        # Raw text frame payloads, decoding is left to the consumer. There is
+        # one reader and one receiver, so a deque and an event are enough.
+        self._inbox: Deque[bytes] = deque()
+        self._inbox_event = asyncio.Event()
+        # Serialized outgoing frames, None wakes the writer loop to exit. The
+        # bound makes send() wait on a peer that is not reading.
+        self._out_queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(
+            _MAX_QUEUED_FRAMES
+        )
+        # Bytes read from the socket that do not yet form a complete frame
+        self._recv_buffer = bytearray()
 
     @property
     def closed(self) -> bool:
@@ -58,26 +96,53 @@ class WebSocketHandler:
                     pass
 
         except Exception as e:
-            self.logger.error(f"Connection error: {e}")
+            self.logger.error("Connection error: %s", e)
         finally:
             await self.close()
 
     async def _reader_loop(self) -> None:
         """Read incoming frames from the socket."""
+        read = self.reader.read
+        buffer = self._recv_buffer
+        inbox_append = self._inbox.append
+        inbox_set = self._inbox_event.set
+        out_put = self._out_queue.put
+        max_size = self.protocol.max_size
         try:
             while not self.closed:
-                data = await self.reader.read(65536)
+                data = await read(65536)
                 if not data:
                     break
-                frame, _ = parse_frame(data)
+                buffer += data
+                appended = False
 
-                if frame.opcode == Opcode.TEXT:
-                    message = frame.payload.decode("utf-8")
-                    await self._message_queue.put(message)
-                elif frame.opcode == Opcode.CLOSE:
-                    break
+                # A single read may hold several frames or only part of one
+                while buffer:
+                    try:
+                        frame, consumed = parse_frame(buffer, max_size=max_size)
+                    except IncompleteFrame:
+                        break
+                    del buffer[:consumed]
+
+                    op = frame.opcode
+                    if op is _TEXT:
+                        inbox_append(frame.payload)
+                        appended = True
+                    elif op is _CLOSE:
+                        return
+                    elif op is _PING:
+                        # Hand over what is parsed so far before waiting on a
+                        # full out queue, so recv() is not left waiting too
+                        if appended:
+                            inbox_set()
+                            appended = False
+                        await out_put(_serialize_control(_PONG, frame.payload))
+
+                # Wake the receiver once for everything parsed from this read
+                if appended:
+                    inbox_set()
         except Exception as e:
-            self.logger.error(f"Reader error: {e}")
+            self.logger.error("Reader error: %s", e)
         finally:
             await self.close()
 
@@ -85,21 +150,41 @@ class WebSocketHandler:
         """Write outgoing frames to the socket."""
         try:
             while not self.closed:
-                outgoing = self.protocol.get_outgoing_data()
-                if outgoing:
-                    self.writer.write(outgoing)
-                    await self.writer.drain()
-                await asyncio.sleep(0.01)
+                data = await self._out_queue.get()
+                if data is None:
+                    break
+
+                # Coalesce frames already queued into one write and drain
+                chunks = [data]
+                stop = False
+                while len(chunks) < _MAX_WRITE_BATCH:
+                    try:
+                        data = self._out_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    if data is None:
+                        stop = True
+                        break
+                    chunks.append(data)
+
+                self.writer.writelines(chunks)
+                await self.writer.drain()
+                if stop:
+                    break
         except Exception as e:
-            self.logger.error(f"Writer error: {e}")
+            self.logger.error("Writer error: %s", e)
         finally:
             await self.close()
 
     async def _handle_handshake(self) -> None:
-        # Read HTTP request
-        data = await self.reader.read(65536)
-        if not data:
+        # Read exactly the HTTP request head, leaving any frames that follow
+        # it in the stream for the reader loop
+        try:
+            data = await self.reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
             raise WebSocketError("Client disconnected during handshake")
+        except asyncio.LimitOverrunError:
+            raise WebSocketError("Handshake request too large")
 
         request, _ = parse_request(data)
         validate_handshake(request.headers, client_mode=False)
@@ -121,41 +206,45 @@ class WebSocketHandler:
 
         self.protocol.state.transition(State.OPEN)
 
-    async def send(self, data: str) -> None:
+    async def send(self, data: Union[str, bytes]) -> None:
         if self.closed:
             raise WebSocketError("Connection is closed")
 
-        frame = Frame(fin=True, opcode=Opcode.TEXT, payload=data.encode("utf-8"))
-        self.writer.write(frame.serialize(mask=False))
-        await self.writer.drain()
-
-    async def recv(self, timeout: Optional[float] = None) -> str:
-        if self.closed:
-            raise WebSocketError("Connection is closed")
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        frame = Frame(fin=True, opcode=Opcode.TEXT, payload=data)
+        await self._out_queue.put(frame.serialize(mask=False))
 
+    async def recv(self, timeout: Optional[float] = None) -> bytes:
+        inbox = self._inbox
         try:
-            if timeout is not None:
-                message = await asyncio.wait_for(
-                    self._message_queue.get(), timeout=timeout
-                )
-            else:
-                message = await self._message_queue.get()
-            return message
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(timeout):
+                while not inbox:
+                    if self.closed:
+                        raise WebSocketError("Connection is closed")
+                    await self._inbox_event.wait()
+                    self._inbox_event.clear()
+        except TimeoutError:
             raise WebSocketError("Receive timeout")
-        except Exception as e:
-            raise WebSocketError(f"Error receiving message: {e}")
+        return inbox.popleft()
 
     async def close(self, code: int = CloseCode.NORMAL) -> None:
         if self._closed:
             return
 
         self._closed = True
+        # Wake a pending recv() so it sees the closed state
+        self._inbox_event.set()
         try:
-            frame = Frame(
-                fin=True, opcode=Opcode.CLOSE, payload=bytes([code >> 8, code & 0xFF])
-            )
-            self.writer.write(frame.serialize(mask=False))
+            # Flush frames still queued ahead of the close frame
+            while not self._out_queue.empty():
+                data = self._out_queue.get_nowait()
+                if data is not None:
+                    self.writer.write(data)
+            self._out_queue.put_nowait(None)
+
+            payload = bytes([code >> 8, code & 0xFF])
+            self.writer.write(_serialize_control(_CLOSE, payload))
             await self.writer.drain()
             self.writer.close()
             await self.writer.wait_closed()
@@ -22,6 +22,7 @@ __all__ = [
 BytesLike = Union[bytes, bytearray, memoryview]
 
 GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_GUID_BYTES = GUID.encode("ascii")
 
 
 def generate_key() -> str:
@@ -49,14 +50,15 @@ def compute_accept_key(key: str) -> str:
 
     try:
         # Verify the key is valid base64
-        decoded = base64.b64decode(key.encode(), validate=True)
+        raw_key = key.encode("ascii")
+        decoded = base64.b64decode(raw_key, validate=True)
         if len(decoded) != 16:
             raise ValueError("Invalid key length")
     except Exception as e:
         raise ValueError(f"Invalid key format: {e}")
 
-    accept = hashlib.sha1((key + GUID).encode()).digest()
-    return base64.b64encode(accept).decode()
+    accept = hashlib.sha1(raw_key + _GUID_BYTES).digest()
+    return base64.b64encode(accept).decode("ascii")
 
 
 def apply_mask(data: BytesLike, mask: bytes) -> bytes: